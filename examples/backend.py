@@ -2,14 +2,48 @@
 Backend module for offering various functions.
 """
 
+import atexit
+import functools
 import random
 import time
 import logging
+import queue
 import sqlite3
-from typing import Any
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# The number of prepared statements cached by each pooled connection.
+_CACHED_STATEMENTS = 256
+# The maximum number of pooled connections, i.e., open database files.
+_MAX_CONNECTIONS = 16
+# The maximum number of queued writes committed by the writer thread at once.
+_WRITE_BATCH_SIZE = 256
+# The maximum time in seconds for waiting until a queued write is committed.
+_WRITE_TIMEOUT = 60
+
+_COLUMNS_SQL = "SELECT * FROM {table} LIMIT 0"
+_READ_SQL = 'SELECT "{column}" FROM {table} WHERE rowid = (SELECT max(rowid) FROM {table})'
+_READ_INT_SQL = (
+    'SELECT CASE WHEN typeof("{column}") = \'integer\' THEN "{column}" END '
+    "FROM {table} WHERE rowid = (SELECT max(rowid) FROM {table})"
+)
+_NOW_SQL = "SELECT datetime('now', 'localtime')"
+_WRITE_SQL = "INSERT INTO {table} VALUES (?, ?)"
+
+# db_path -> (connection, lock), in the least recently used order.
+_connections: "OrderedDict[str, Tuple[sqlite3.Connection, threading.Lock]]" = OrderedDict()
+_connections_lock = threading.Lock()
+# (db_path, table, template) -> (connection, (data_version, total_changes), value)
+#   of the last read, where the versions are only valid for the connection.
+_read_cache: Dict[Tuple[str, str, str], Tuple[sqlite3.Connection, Tuple[int, int], Any]] = {}
+# (db_path, table) -> the name of the first column.
+_first_columns: Dict[Tuple[str, str], str] = {}
+
 
 def generate() -> int:
     """Generates a random number from 0 to 99.
@@ -17,7 +51,7 @@ def generate() -> int:
     Returns:
         Generated number.
     """
-    return random.randrange(0, 100)
+    return random.randrange(100)
 
 
 def poll() -> int:
@@ -29,18 +63,233 @@ def poll() -> int:
     return int(time.time()) % 100
 
 
+def _enable_wal(con: sqlite3.Connection):
+    """Switches the database to WAL mode with NORMAL synchronous mode.
+
+    In WAL mode, a commit does not need to sync the journal and the database
+      file both, and readers do not block the writer.
+    If the database cannot use WAL, e.g., an in-memory database, it keeps
+      the original journal mode and synchronous mode.
+
+    Args:
+        con: A connection to the database.
+    """
+    mode = con.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+    if mode.lower() != "wal":
+        logger.debug("Failed to enable WAL mode, the journal mode is %s.", mode)
+        return
+    con.execute("PRAGMA synchronous=NORMAL")
+    con.execute("PRAGMA wal_autocheckpoint=1000")
+
+
+@contextmanager
+def _connection(db_path: str) -> Iterator[sqlite3.Connection]:
+    """Yields the pooled connection to the database, creating it on the first use.
+
+    Opening a connection costs file opens and a schema parse, so a connection
+    is kept open for each database and reused by the following calls.
+    At most _MAX_CONNECTIONS connections are kept, and the least recently used
+    one is closed when a new one is opened.
+    The connection is locked in the 'with' statement, since it may be used
+    by several threads.
+
+    Args:
+        db_path: A path of database file.
+    """
+    while True:
+        with _connections_lock:
+            pooled = _connections.get(db_path)
+            if pooled is not None:
+                _connections.move_to_end(db_path)
+        if pooled is None:
+            pooled = _add(db_path)
+        con, lock = pooled
+        with lock:
+            # it may have been evicted before the lock is acquired
+            if _connections.get(db_path) is pooled:
+                yield con
+                return
+
+
+def _add(db_path: str) -> Tuple[sqlite3.Connection, threading.Lock]:
+    """Opens a new connection to the database and adds it to the pool.
+
+    The connection is opened, and the evicted one is closed, without holding
+      _connections_lock, since they may wait for the locked database files.
+    Hence, the other databases can be used meanwhile.
+
+    Args:
+        db_path: A path of database file.
+
+    Returns:
+        The (connection, lock) tuple in the pool, which may have been added
+          by another thread meanwhile.
+    """
+    con = _open(db_path)
+    evicted = None
+    with _connections_lock:
+        pooled = _connections.get(db_path)
+        if pooled is None:
+            pooled = _connections[db_path] = (con, threading.Lock())
+            if len(_connections) > _MAX_CONNECTIONS:
+                evicted = _connections.popitem(last=False)
+        else:
+            _connections.move_to_end(db_path)
+    if pooled[0] is not con:
+        con.close()
+    if evicted is not None:
+        _evict(*evicted)
+    return pooled
+
+
+def _open(db_path: str) -> sqlite3.Connection:
+    """Opens and configures a new connection to the database.
+
+    Args:
+        db_path: A path of database file.
+    """
+    con = sqlite3.connect(
+        db_path, check_same_thread=False, cached_statements=_CACHED_STATEMENTS
+    )
+    _enable_wal(con)
+    con.execute("PRAGMA temp_store=MEMORY")
+    con.execute("PRAGMA cache_size=-64000")
+    con.execute("PRAGMA busy_timeout=5000")
+    # TEXT values are not decoded, since the read values are usually numbers.
+    con.text_factory = bytes
+    logger.info("Opened a connection to database %s.", db_path)
+    return con
+
+
+def _evict(db_path: str, pooled: Tuple[sqlite3.Connection, threading.Lock]):
+    """Closes the connection removed from the pool, once it is not used.
+
+    The cached reads of the database are dropped as well, since they are
+      only valid for the closed connection.
+
+    Args:
+        db_path: A path of database file.
+        pooled: The (connection, lock) tuple removed from _connections.
+    """
+    con, lock = pooled
+    with lock:
+        con.close()
+    # copied at once, since other threads may add reads meanwhile
+    for key in list(_read_cache):
+        if key[0] == db_path:
+            _read_cache.pop(key, None)
+    logger.info("Closed the least recently used connection to database %s.", db_path)
+
+
+@functools.lru_cache(maxsize=128)
+def _format_sql(template: str, table: str, column: str = "") -> str:
+    """Returns the SQL statement formatted with the table and column names.
+
+    The names cannot be bound as parameters, hence they are formatted into
+      the statement, only once for each template, table and column.
+
+    Args:
+        template: One of the SQL statement templates, e.g., _READ_SQL.
+        table: A name of table.
+        column: A name of column, if the template has one.
+          It is quoted, hence it can be any column name.
+
+    Raises:
+        ValueError: When the table name is not a valid identifier.
+    """
+    if not table.isidentifier():
+        raise ValueError(f"Invalid table name: {table!r}")
+    return template.format(table=table, column=column.replace('"', '""'))
+
+
+def _first_column(con: sqlite3.Connection, db_path: str, table: str) -> str:
+    """Returns the name of the first column of the table.
+
+    The name is looked up only once for each table, then it is cached.
+
+    Args:
+        con: A connection to the database.
+        db_path: A path of database file.
+        table: A name of table.
+    """
+    column = _first_columns.get((db_path, table))
+    if column is None:
+        cursor = con.execute(_format_sql(_COLUMNS_SQL, table))
+        column = _first_columns[(db_path, table)] = cursor.description[0][0]
+    return column
+
+
+@atexit.register
+def _close_connections():
+    """Closes all the pooled connections."""
+    with _connections_lock:
+        for con, lock in _connections.values():
+            with lock:
+                con.close()
+        _connections.clear()
+    _read_cache.clear()
+    _first_columns.clear()
+
+
+def _read_last(db_path: str, table: str, template: str) -> Any:
+    """Reads the first column of the last row in the table with the given query.
+
+    The read value is cached until the database is changed, either through
+      the pooled connection or by any other connection.
+
+    Args:
+        db_path: See read().
+        table: See read().
+        template: The SQL statement template of the query,
+          i.e., _READ_SQL or _READ_INT_SQL.
+
+    Returns:
+        The read value if reading is successful, otherwise None.
+    """
+    if db_path == "":
+        return None
+    key = (db_path, table, template)
+    try:
+        with _connection(db_path) as con:
+            # data_version only changes when another connection commits.
+            version = (con.execute("PRAGMA data_version").fetchone()[0], con.total_changes)
+            cached = _read_cache.get(key)
+            if cached is not None and cached[0] is con and cached[1] == version:
+                return cached[2]
+            sql = _format_sql(template, table, _first_column(con, db_path, table))
+            row = con.execute(sql).fetchone()
+    except (sqlite3.Error, ValueError):
+        # the table may have been altered
+        _first_columns.pop((db_path, table), None)
+        logger.exception("Failed to read table %s from database %s.", table, db_path)
+        return None
+    if row is None:
+        logger.error("Failed to read table %s from database %s, which is empty.", table, db_path)
+        return None
+    value = row[0]
+    _read_cache[key] = (con, version, value)
+    return value
+
+
 def read(db_path: str, table: str) -> Any:
     """Reads the value from the database.
 
     It can only read the last row in a specific table.
+    Only the first column is fetched.
+    The read value is cached until the database is changed, either through
+      the pooled connection or by any other connection.
 
     Database structure:
         There is at least one table and in the table, there is at least one column.
         The value to read should be in the first column.
+        The table should be a rowid table, which is the default,
+          i.e., it should not be created with WITHOUT ROWID.
 
     Error handling:
-        An error may occur if it tries to access the database before another one commits.
+        An error may occur if it tries to access the database before another one commits,
+          or if the table name is not a valid identifier.
         If so, the error will be catched by try-except statement and showed.
+        Reading an empty table is also treated as a failure.
         See the returning value in returns description. 
 
     Args:
@@ -50,21 +299,30 @@ def read(db_path: str, table: str) -> Any:
 
     Returns:
         The read value if reading is successful, otherwise None.
+        A TEXT value is returned as bytes, without being decoded.
     """
-    if db_path == "":
-        return None
-    con = sqlite3.connect(db_path)
-    try:
-        with con:
-            value = con.execute(
-                f"SELECT * FROM {table} ORDER BY rowid DESC LIMIT 1"
-            ).fetchone()[0]
-    except sqlite3.Error:
-        logger.exception("Failed to read table %s from database %s.", table, db_path)
-        return None
-    finally:
-        con.close()
-    return value
+    return _read_last(db_path, table, _READ_SQL)
+
+
+def read_int(db_path: str, table: str) -> Optional[int]:
+    """Reads the integer value from the database.
+
+    It is the same as read(), except that the type of the value is checked by SQLite.
+
+    Database structure:
+        See read().
+
+    Error handling:
+        See read().
+
+    Args:
+        db_path: See read().
+        table: See read().
+
+    Returns:
+        The read value if reading is successful and its type is integer, otherwise None.
+    """
+    return _read_last(db_path, table, _READ_INT_SQL)
 
 
 def write(db_path: str, table: str, value: Any) -> bool:
@@ -73,13 +331,20 @@ def write(db_path: str, table: str, value: Any) -> bool:
     It can only add the value into the last row in a specific table.
     The value and saved time are read in the first and second column, respectively. 
 
+    The value is queued and written by a single writer thread, which commits
+      the values queued by concurrent callers in one transaction per table.
+    It blocks until the value is committed, hence it should not be called
+      in the GUI thread.
+
     Database structure:
         See read().
 
     Error handling:
-        An error may occur if it tries to access the database before another one commits.
-        If so, the error will be catched by try-except statement and showed.
-        See the returning value in returns description. 
+        See write_many().
+        If the value is not committed in _WRITE_TIMEOUT seconds, it stops waiting
+          and returns False, even though the value may be written afterwards.
+        An unexpected exception raised by writing the value, e.g., OverflowError
+          for a too large integer, is re-raised to the caller.
 
     Args:
         db_path: A path of database file.
@@ -87,21 +352,196 @@ def write(db_path: str, table: str, value: Any) -> bool:
         table: A name of table to write down.
         value: A value to write to the given location.
 
+    Returns:
+        True if writing is successful, otherwise False.
+    """
+    future = write_async(db_path, table, value)
+    try:
+        return future.result(timeout=_WRITE_TIMEOUT)
+    except FutureTimeoutError:
+        logger.error("Timed out writing a value into table %s of database %s", table, db_path)
+        return False
+
+
+def write_async(
+    db_path: str,
+    table: str,
+    value: Any,
+    callback: Optional[Callable[[bool], Any]] = None
+) -> "Future[bool]":
+    """Queues the value to write to the database, without waiting for it.
+
+    It is the same as write(), except that it returns immediately, hence it can
+      be called in the GUI thread.
+
+    Args:
+        db_path: See write().
+        table: See write().
+        value: See write().
+        callback: A function called with the returning value of write() in
+          the writer thread, once the value is written.
+          If writing raises an unexpected exception, it is logged with its traceback
+          and the callback is called with False.
+
+    Returns:
+        A future whose result is the returning value of write().
+        An unexpected exception raised by writing the value is set to the future.
+        The callbacks added to the future are called in the writer thread.
+    """
+    future = _writer.submit(db_path, table, value)
+    if callback is not None:
+        future.add_done_callback(functools.partial(_report_write, callback))
+    return future
+
+
+def _report_write(callback: Callable[[bool], Any], future: "Future[bool]"):
+    """Calls the callback with the result of the written future.
+
+    Args:
+        callback: See write_async().
+        future: The future returned by write_async(), which is done.
+    """
+    error = future.exception()
+    if error is not None:
+        logger.error("Failed to write a value due to an unexpected error.", exc_info=error)
+    callback(error is None and future.result())
+
+
+def write_many(db_path: str, table: str, values: Iterable[Any]) -> bool:
+    """Writes the values to the database in a single transaction.
+
+    The values are added in order after the last row in a specific table.
+    Since they are committed at once, the commit cost is shared by all the values.
+    The saved time is computed by SQLite, not in Python, only once for all the values.
+
+    Database structure:
+        See read().
+
+    Error handling:
+        An error may occur if it tries to access the database before another one commits,
+          or if the table name is not a valid identifier.
+        If so, the error will be catched by try-except statement and showed,
+          and none of the values are written.
+        See the returning value in returns description. 
+
+    Args:
+        db_path: A path of database file.
+          It will be an empty string if the user does not select a specific database.
+        table: A name of table to write down.
+        values: Values to write to the given location.
+
     Returns:
         True if writing is successful, otherwise False.
     """
     if db_path == "":
         return False
-    con = sqlite3.connect(db_path)
     try:
-        with con:
-            con.execute(
-                f"INSERT INTO {table} VALUES (?, datetime('now', 'localtime'))", 
-                (value,)
-            )
-    except sqlite3.Error:
-        logger.exception("Failed to write a value into table %s of database %s", table, db_path)
+        sql = _format_sql(_WRITE_SQL, table)
+        with _connection(db_path) as con:
+            with con:
+                # decoded to be saved as TEXT, since the text factory is bytes
+                now = con.execute(_NOW_SQL).fetchone()[0].decode()
+                con.executemany(sql, ((value, now) for value in values))
+    except (sqlite3.Error, ValueError):
+        logger.exception("Failed to write values into table %s of database %s", table, db_path)
         return False
-    finally:
-        con.close()
     return True
+
+
+class _Writer:
+    """Writer thread which commits the queued values in batches.
+
+    The thread is started by the first write, and stopped by flush().
+
+    Attributes:
+        queue: A queue of (db_path, table, value, future) for each write,
+          or None to stop the thread.
+        thread: The writer thread, or None if it has not been started.
+        lock: A lock for starting and stopping the thread.
+    """
+
+    def __init__(self):
+        self.queue: "queue.SimpleQueue[Optional[Tuple[str, str, Any, Future]]]" = (
+            queue.SimpleQueue()
+        )
+        self.thread: Optional[threading.Thread] = None
+        self.lock = threading.Lock()
+
+    def submit(self, db_path: str, table: str, value: Any) -> "Future[bool]":
+        """Queues the value to write.
+
+        See write_async() for the arguments and the returning value.
+        """
+        future = Future()
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self._run, name="backend-writer", daemon=True)
+                self.thread.start()
+            self.queue.put((db_path, table, value, future))
+        return future
+
+    def flush(self):
+        """Waits until all the queued values are written, and stops the thread."""
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                return
+            self.queue.put(None)
+            self.thread.join()
+
+    def _run(self):
+        """Writes the queued values in batches until None is queued.
+
+        The values in a batch are grouped by the database and table,
+          and each group is written by _write_group().
+        """
+        running = True
+        while running:
+            batch = [self.queue.get()]
+            while len(batch) < _WRITE_BATCH_SIZE:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            if None in batch:
+                running = False
+                batch = [item for item in batch if item is not None]
+            groups: Dict[Tuple[str, str], List[Tuple[Any, Future]]] = {}
+            for db_path, table, value, future in batch:
+                groups.setdefault((db_path, table), []).append((value, future))
+            for (db_path, table), entries in groups.items():
+                self._write_group(db_path, table, entries)
+
+    def _write_group(self, db_path: str, table: str, entries: List[Tuple[Any, Future]]):
+        """Writes the values by write_many() and resolves their futures.
+
+        If write_many() raises an exception, the values are written again one by one,
+          so that only the future of the bad value gets the exception.
+
+        Args:
+            db_path: A path of database file.
+            table: A name of table to write down.
+            entries: A list of (value, future) for each value to write.
+        """
+        try:
+            success = write_many(db_path, table, [value for value, _ in entries])
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            if len(entries) > 1:
+                for entry in entries:
+                    self._write_group(db_path, table, [entry])
+            else:
+                entries[0][1].set_exception(error)
+            return
+        for _, future in entries:
+            future.set_result(success)
+
+
+_writer = _Writer()
+
+
+@atexit.register
+def flush():
+    """Waits until all the queued values are written, and stops the writer thread.
+
+    The writer thread is started again by the next write().
+    """
+    _writer.flush()
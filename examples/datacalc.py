@@ -6,16 +6,20 @@ import os
 import json
 import logging
 import functools
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Optional, Dict, Tuple
 
-from PyQt5.QtCore import QObject, pyqtSlot
+from PyQt5.QtCore import QObject, QSignalBlocker, pyqtSignal, pyqtSlot
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QComboBox, QPushButton, QLabel
 
 from qiwis import BaseApp
-from examples.backend import read
+from examples.backend import read_int
 
 logger = logging.getLogger(__name__)
 
+# The keys which every database in the db channel message should have.
+_DB_KEYS = frozenset(("name", "path"))
+
 
 class ViewerFrame(QWidget):
     """Frame of for selecting databases and showing the calculated number.
@@ -57,10 +61,28 @@ class DataCalcApp(BaseApp):
           It is offered as the constructor argument.
         dbs: A dictionary for storing available databases.
           Each element represents a database.
-          A key is a file name and its value is an absolute path.
+          A key is a file name and its value is the path of the database file,
+          which is joined once when the database is added.
         dbNames: A dictionary for storing names of the selected databases.
+        dbPaths: A dictionary for storing full paths of the selected databases.
+          It is updated in self.setDB().
+          The value is an empty string if no database is selected.
         viewerFrame: A frame that selects databases and shows the calculated number.
+        readFutures: A dictionary of the futures reading the values for the running
+          calculation, whose keys are the same as dbPaths.
+          It is None if no calculation is running.
+        readExecutor: An executor with a thread for each database to read concurrently.
+          It is shut down when the app is destroyed.
+
+    Signals:
+        readFinished(): One of the values is read. It is emitted in the reading thread.
     """
+
+    # channel name -> name of the handler method which takes the received dictionary.
+    CHANNEL_HANDLERS = {"db": "updateDB"}
+
+    readFinished = pyqtSignal()
+
     def __init__(self, name: str, tables: Dict[str, str], parent: Optional[QObject] = None):
         """Extended.
 
@@ -71,13 +93,18 @@ class DataCalcApp(BaseApp):
         self.tables = tables
         self.dbs = {"": ""}
         self.dbNames = {"A": "", "B": ""}
+        self.dbPaths = {"A": "", "B": ""}
         self.viewerFrame = ViewerFrame()
+        self.readFutures: Optional[Dict[str, Future]] = None
+        self.readExecutor = ThreadPoolExecutor(max_workers=len(tables))
+        self.destroyed.connect(functools.partial(self.readExecutor.shutdown, wait=False))
         for dbBox in self.viewerFrame.dbBoxes.values():
             dbBox.addItem("")
         # connect signals to slots
         for dbName, dbBox in self.viewerFrame.dbBoxes.items():
             dbBox.currentIndexChanged.connect(functools.partial(self.setDB, dbName))
         self.viewerFrame.calculateButton.clicked.connect(self.calculateSum)
+        self.readFinished.connect(self.showSum)
 
     def frames(self) -> Tuple[Tuple[str, ViewerFrame]]:
         """Overridden."""
@@ -90,31 +117,43 @@ class DataCalcApp(BaseApp):
             The new database is always added at the end.
             Changing the order of the databases is not allowed.
 
+        Only the added and removed databases are applied to the comboboxes,
+          with their signals blocked. Then, self.setDB() is called only for
+          the combobox whose selected database is removed.
+
         Args:
             content: Received content.
               The structure follows the message protocol of DBMgrApp.
         """
-        originalDBs = set(self.dbs)
-        newDBs = set([""])
+        newDBs = {""}
+        addingDBs = []
         for db in content.get("db", ()):
-            if any(key not in db for key in ("name", "path")):
+            if not _DB_KEYS <= db.keys():
                 logger.error("The message was ignored because "
                              "the database %s has no such key; name or path.", json.dumps(db))
                 continue
             name, path = db["name"], db["path"]
             newDBs.add(name)
             if name not in self.dbs:
-                self.dbs[name] = path
-                for dbBox in self.viewerFrame.dbBoxes.values():
-                    dbBox.addItem(name)
-        removingDBs = originalDBs - newDBs
-        for dbBox in self.viewerFrame.dbBoxes.values():
-            if dbBox.currentText() in removingDBs:
-                dbBox.setCurrentText("")
+                self.dbs[name] = os.path.join(path, name)
+                addingDBs.append(name)
+        # the added databases are in newDBs, hence only the missing ones remain
+        removingDBs = self.dbs.keys() - newDBs
+        if not addingDBs and not removingDBs:
+            return
+        # the comboboxes have the databases in the same order as self.dbs
+        removingRows = [row for row, name in enumerate(self.dbs) if name in removingDBs]
         for name in removingDBs:
             self.dbs.pop(name)
-            for dbBox in self.viewerFrame.dbBoxes.values():
-                dbBox.removeItem(dbBox.findText(name))
+        for boxName, dbBox in self.viewerFrame.dbBoxes.items():
+            with QSignalBlocker(dbBox):
+                if dbBox.currentText() in removingDBs:
+                    dbBox.setCurrentText("")
+                dbBox.addItems(addingDBs)
+                for row in reversed(removingRows):
+                    dbBox.removeItem(row)
+            if dbBox.currentText() != self.dbNames[boxName]:
+                self.setDB(boxName)
 
     def receivedSlot(self, channelName: str, content: Any):
         """Overridden.
@@ -123,15 +162,17 @@ class DataCalcApp(BaseApp):
 
         "db": Database channel.
             See self.updateDB().
+
+        The content is passed to the handler method of the channel in CHANNEL_HANDLERS.
         """
-        if channelName == "db":
-            if isinstance(content, dict):
-                self.updateDB(content)
-            else:
-                logger.error("The message for the channel db should be a dictionary.")
-        else:
+        handlerName = self.CHANNEL_HANDLERS.get(channelName)
+        if handlerName is None:
             logger.error("The message was ignored because "
                          "the treatment for the channel %s is not implemented.", channelName)
+        elif isinstance(content, dict):
+            getattr(self, handlerName)(content)
+        else:
+            logger.error("The message for the channel %s should be a dictionary.", channelName)
 
     @pyqtSlot(str)
     def setDB(self, name: str):
@@ -141,7 +182,8 @@ class DataCalcApp(BaseApp):
             name: A name of the selected combobox.
         """
         dbBox = self.viewerFrame.dbBoxes[name]
-        self.dbNames[name] = dbBox.currentText()
+        dbName = self.dbNames[name] = dbBox.currentText()
+        self.dbPaths[name] = self.dbs[dbName]
         if self.dbNames[name]:
             logger.info("Database %s is set as %s.", name, self.dbNames[name])
         else:
@@ -149,20 +191,32 @@ class DataCalcApp(BaseApp):
 
     @pyqtSlot()
     def calculateSum(self):
-        """Calculates and shows the sum of two values when the button is clicked."""
-        result = 0
-        for name, dbName in self.dbNames.items():
-            dbPath = self.dbs[dbName]
-            table = self.tables[name]
-            value = read(os.path.join(dbPath, dbName), table)
-            if value is None:
-                self.viewerFrame.numberLabel.setText(f"failed to fetch number from {name}")
-                break
-            if not isinstance(value, int):
-                self.viewerFrame.numberLabel.setText(f"The type of value from {name} "
-                                                     f"should be an integer")
-                break
-            result += value
+        """Starts calculating the sum of two values when the button is clicked.
+
+        The values are read concurrently by self.readExecutor, hence the total time
+        is bounded by the slowest read. The button is disabled until the result is shown.
+        """
+        self.readFutures = {
+            name: self.readExecutor.submit(read_int, dbPath, self.tables[name])
+            for name, dbPath in self.dbPaths.items()
+        }
+        self.viewerFrame.calculateButton.setEnabled(False)
+        for future in self.readFutures.values():
+            future.add_done_callback(lambda _: self.readFinished.emit())
+
+    @pyqtSlot()
+    def showSum(self):
+        """Shows the sum of the values, or an error message, once all the values are read."""
+        if self.readFutures is None or not all(f.done() for f in self.readFutures.values()):
+            return
+        values = {name: future.result() for name, future in self.readFutures.items()}
+        self.readFutures = None
+        failed = [name for name, value in values.items() if value is None]
+        if failed:
+            text = f"failed to fetch an integer from {failed[0]}"
         else:
-            self.viewerFrame.numberLabel.setText(f"sum: {result}")
-            logger.info("Sum: %f.", result)
+            result = sum(values.values())
+            logger.info("Sum: %d.", result)
+            text = f"sum: {result}"
+        self.viewerFrame.numberLabel.setText(text)
+        self.viewerFrame.calculateButton.setEnabled(True)
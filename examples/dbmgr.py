@@ -5,57 +5,131 @@ App module for adding and removing available databases.
 import os
 import logging
 from collections import namedtuple
-from typing import Optional, Tuple
+from json.encoder import encode_basestring_ascii
+from typing import Iterable, List, Optional, Sequence, Tuple
 
-from PyQt5.QtCore import QObject, pyqtSlot
-from PyQt5.QtWidgets import (QWidget, QLabel, QPushButton, QFileDialog,
-                             QHBoxLayout, QVBoxLayout, QListWidget, QListWidgetItem)
+from PyQt5.QtCore import (
+    QAbstractItemModel, QAbstractTableModel, QEvent, QModelIndex, QObject, Qt, QTimer,
+    pyqtSignal, pyqtSlot
+)
+from PyQt5.QtGui import QPainter
+from PyQt5.QtWidgets import (
+    QApplication, QPushButton, QFileDialog, QStyle, QStyledItemDelegate,
+    QStyleOptionButton, QStyleOptionViewItem, QTableView, QVBoxLayout, QWidget
+)
 
 from qiwis import AppInfo, BaseApp
 
 logger = logging.getLogger(__name__)
 
 
-class DBWidget(QWidget):
-    """Widget for showing a database.
+class DBTableModel(QAbstractTableModel):
+    """Table model for showing available databases.
+
+    Each row represents a database, and the columns are the file name,
+      the absolute path and the remove button, respectively.
 
     Attributes:
-        name: A file name of the database.
-        path: An absolute path of the database.
-        nameLabel: A label for showing the file name.
-        pathLabel: A label for showing the absolue path.
-        removeButton: A button for removing (disconnecting) the database.
+        dbList: A list of databases. See DBMgrApp.dbList.
     """
-    def __init__(self, name: str, path: str, parent: Optional[QObject] = None):
-        """"Extended.
+
+    REMOVE_COLUMN = 2
+
+    def __init__(self, dbList: List[Tuple[str, str]], parent: Optional[QObject] = None):
+        """Extended.
 
         Args:
-            path: An absolute path of the database.
+            dbList: See DBTableModel.dbList.
+              It should be modified only through this model.
         """
         super().__init__(parent=parent)
-        self.name = name
-        self.path = path
-        self._initWidget()
-
-    def _initWidget(self):
-        """Initializes widgets in the item."""
-        self.nameLabel = QLabel(self.name, self)
-        self.pathLabel = QLabel(self.path, self)
-        self.removeButton = QPushButton("remove", self)
-        # set layout
-        layout = QHBoxLayout(self)
-        layout.addWidget(self.nameLabel)
-        layout.addWidget(self.pathLabel)
-        layout.addWidget(self.removeButton)
+        self.dbList = dbList
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Overridden."""
+        return 0 if parent.isValid() else len(self.dbList)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Overridden."""
+        return 0 if parent.isValid() else 3
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Optional[str]:
+        """Overridden."""
+        if role != Qt.DisplayRole:
+            return None
+        db = self.dbList[index.row()]
+        return (db.name, db.path, "remove")[index.column()]
+
+    def appendDBs(self, dbs: Sequence[Tuple[str, str]]):
+        """Appends the databases at the end of dbList.
+
+        They are inserted at once, hence the view is updated only once.
+
+        Args:
+            dbs: Databases to append. See DBMgrApp.DB.
+        """
+        if not dbs:
+            return
+        first = len(self.dbList)
+        self.beginInsertRows(QModelIndex(), first, first + len(dbs) - 1)
+        self.dbList.extend(dbs)
+        self.endInsertRows()
+
+    def removeDB(self, row: int):
+        """Removes the database from dbList.
+
+        Args:
+            row: The index of the database to remove.
+        """
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.dbList[row]
+        self.endRemoveRows()
+
+
+class RemoveButtonDelegate(QStyledItemDelegate):
+    """Delegate that draws a push button and reports its click.
+
+    The button is only painted, so no QPushButton is created for each row.
+
+    Signals:
+        clicked(row): The button in the row is clicked.
+    """
+
+    clicked = pyqtSignal(int)
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        """Overridden."""
+        button = QStyleOptionButton()
+        button.rect = option.rect
+        button.text = index.data()
+        button.state = QStyle.State_Enabled
+        QApplication.style().drawControl(QStyle.CE_PushButton, button, painter)
+
+    def editorEvent(
+        self,
+        event: QEvent,
+        model: QAbstractItemModel,
+        option: QStyleOptionViewItem,
+        index: QModelIndex
+    ) -> bool:
+        """Overridden.
+
+        Emits the clicked signal when the left mouse button is released.
+        """
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            self.clicked.emit(index.row())
+            return True
+        return super().editorEvent(event, model, option, index)
 
 
 class ManagerFrame(QWidget):
     """Frame for managing available databases.
 
     Attributes:
-        dbListWidget: A list widget for showing available databases.
+        dbTableView: A table view for showing available databases.
           Each database can be removed (actually disconnected) 
-          when removeButton (of each item) clicked.
+          when the remove button of its row is clicked.
+        removeButtonDelegate: A delegate for the remove buttons in dbTableView.
         addButton: A button for adding (actually connecting) a database.
         openCloseDatacalcButton: A button for opening or closing a datacalc app.
     """
@@ -63,12 +137,19 @@ class ManagerFrame(QWidget):
         """Extended."""
         super().__init__(parent=parent)
         # widgets
-        self.dbListWidget = QListWidget(self)
+        self.dbTableView = QTableView(self)
+        self.dbTableView.horizontalHeader().hide()
+        self.dbTableView.verticalHeader().hide()
+        self.dbTableView.horizontalHeader().setStretchLastSection(True)
+        self.removeButtonDelegate = RemoveButtonDelegate(self.dbTableView)
+        self.dbTableView.setItemDelegateForColumn(
+            DBTableModel.REMOVE_COLUMN, self.removeButtonDelegate
+        )
         self.addButton = QPushButton("add", self)
         self.openCloseDatacalcButton = QPushButton("open or close datacalc", self)
         # layout
         layout = QVBoxLayout(self)
-        layout.addWidget(self.dbListWidget)
+        layout.addWidget(self.dbTableView)
         layout.addWidget(self.addButton)
         layout.addWidget(self.openCloseDatacalcButton)
 
@@ -82,7 +163,8 @@ class DBMgrApp(BaseApp):
     Protocol:
         A broadcastRequested signal is emitted 
           when the available databases are changed (added or removed).
-        It is a json object converted to string using json.dumps().
+        The changes made in a single event loop iteration are broadcast once.
+        It is a json object converted to string, in the same way as json.dumps().
         On the receiving end, it can be interpreted using json.loads().
 
         The json object has one key; db. In db, there is a list of databases.  
@@ -94,10 +176,17 @@ class DBMgrApp(BaseApp):
         dbList: A list for storing available databases.
           Each element is a namedtuple which represents a database.
           It has two elements; file name and absolute path.
+          It is modified through dbModel.
+        dbModel: A table model of dbList, which is shown in managerFrame.
+        dbJsons: A list of JSON strings, each of which is converted from
+          the element of dbList at the same index.
+          They are kept so that only the added database is converted to JSON.
         isDatacalcOpen: True if a datacalc app is open, and False if it is close.
         openCloseDatacalcResult: The latest qiwiscall result 
           which requests for opening or closing a datacalc app.
         managerFrame: A frame that manages and shows available databases.
+        broadcastTimer: A zero-interval single-shot timer for broadcasting
+          the database list once after the changes.
     """
     DB = namedtuple("DB", ["path", "name"])
 
@@ -105,10 +194,20 @@ class DBMgrApp(BaseApp):
         """Extended."""
         super().__init__(name, parent=parent)
         self.dbList = []
+        self.dbJsons = []
         self.isDatacalcOpen = False
         self.openCloseDatacalcResult = None
+        self.dbModel = DBTableModel(self.dbList, self)
         self.managerFrame = ManagerFrame()
+        self.managerFrame.dbTableView.setModel(self.dbModel)
+        self.broadcastTimer = QTimer(self)
+        self.broadcastTimer.setSingleShot(True)
+        self.broadcastTimer.setInterval(0)
+        self.broadcastTimer.timeout.connect(self.broadcastDB)
         # connect signals to slots
+        self.managerFrame.removeButtonDelegate.clicked.connect(
+            self.removeDB, type=Qt.QueuedConnection
+        )
         self.managerFrame.addButton.clicked.connect(self.addDB)
         self.managerFrame.openCloseDatacalcButton.clicked.connect(self.openCloseDatacalc)
 
@@ -116,61 +215,77 @@ class DBMgrApp(BaseApp):
         """Overridden."""
         return (("", self.managerFrame),)
 
-    def sendDB(self, isAdded: bool, name: str):
-        """Emits a broadcastRequested signal with the database list and a logging message.
+    def sendDB(self, isAdded: bool, names: Iterable[str]):
+        """Logs the updated databases and schedules broadcasting the database list.
+
+        The database list is broadcast by self.broadcastDB() when the control
+          returns to the event loop, hence it is built only once for the changes
+          made in the meantime.
         
         Args:
-            isAdded: True if a database is added, and False if a databse is removed.
-            name: A file name of the updated database.
+            isAdded: True if databases are added, and False if databases are removed.
+            names: File names of the updated databases.
         """
-        msg = {"db": [db._asdict() for db in self.dbList]}
-        self.broadcast("db", msg)
-        logger.info("Database %s is %s.", name, "added" if isAdded else "removed")
+        logMsg = "Database %s is added." if isAdded else "Database %s is removed."
+        for name in names:
+            logger.info(logMsg, name)
+        self.broadcastTimer.start()
+
+    @pyqtSlot()
+    def broadcastDB(self):
+        """Emits a broadcastRequested signal with the database list."""
+        msg = f'{{"db": [{", ".join(self.dbJsons)}]}}'
+        self.broadcastRequested.emit("db", msg)
 
     @pyqtSlot()
     def addDB(self):
-        """Selects a database and adds to dbList.
+        """Selects databases and adds to dbList.
         
-        Show the database at dbListWidget in ManagerFrame.
-        Emit a broadcastRequested signal containing an added database information.
+        Show the databases at dbTableView in ManagerFrame.
+        Emit a broadcastRequested signal containing added database information.
+        The databases which are already in dbList are ignored, and nothing is emitted
+          if no database is added.
         """
-        dbPath, _ = QFileDialog.getOpenFileName(
+        dbPaths, _ = QFileDialog.getOpenFileNames(
             self.managerFrame,
-            "Select a database file",
+            "Select database files",
             "./"
         )
-        if not dbPath:
+        addedDBs = set(self.dbList)
+        dbs = []
+        for dbPath in dbPaths:
+            db = DBMgrApp.DB._make(os.path.split(dbPath))
+            if db not in addedDBs:
+                addedDBs.add(db)
+                dbs.append(db)
+        # the database list is not changed, so nothing is broadcast
+        if not dbs:
             return
-        db = DBMgrApp.DB._make(os.path.split(dbPath))
-        self.dbList.append(db)
-        # create a database widget
-        widget = DBWidget(db.name, db.path, self.managerFrame.dbListWidget)
-        widget.removeButton.clicked.connect(self.removeDB)
-        item = QListWidgetItem(self.managerFrame.dbListWidget)
-        item.setSizeHint(widget.sizeHint())
-        self.managerFrame.dbListWidget.addItem(item)
-        self.managerFrame.dbListWidget.setItemWidget(item, widget)
-        # send the database list and a logging message
-        self.sendDB(True, db.name)
+        self.dbModel.appendDBs(dbs)
+        # the same as json.dumps(db._asdict()), without building the dictionaries
+        self.dbJsons.extend(
+            f'{{"path": {encode_basestring_ascii(db.path)}, '
+            f'"name": {encode_basestring_ascii(db.name)}}}'
+            for db in dbs
+        )
+        # send the database list and logging messages
+        self.sendDB(True, [db.name for db in dbs])
 
-    @pyqtSlot()
-    def removeDB(self):
-        """Selects a database and removes from dbList.
+    @pyqtSlot(int)
+    def removeDB(self, row: int):
+        """Removes the database from dbList.
         
-        Show the database at dbListWidget in ManagerFrame.
-        Emit a broadcastRequested signal containing an added database information.
+        Remove the database from dbTableView in ManagerFrame.
+        Emit a broadcastRequested signal containing a removed database information.
+
+        Args:
+            row: The index of the database whose remove button is clicked.
         """
-        # find the selected database
-        widget = self.sender().parent()
-        db = DBMgrApp.DB(name=widget.name, path=widget.path)
-        row = self.dbList.index(db)
-        # remove the database widget
-        item = self.managerFrame.dbListWidget.takeItem(row)
-        del self.dbList[row]
-        del item
-        widget.deleteLater()
+        name = self.dbList[row].name
+        self.dbModel.removeDB(row)
+        del self.dbJsons[row]
         # send the database list and a logging message
-        self.sendDB(False, db.name)
+        self.sendDB(False, (name,))
 
     @pyqtSlot()
     def openCloseDatacalc(self):
@@ -1,11 +1,15 @@
 """App module for logging."""
 
 import logging
-from typing import Any, Optional, Tuple, Callable
+import time
+from collections import deque
+from typing import Any, Optional, Sequence, Tuple, Callable
 
-from PyQt5.QtCore import QObject, pyqtSlot, pyqtSignal, QDateTime
+from PyQt5.QtCore import (
+    QObject, pyqtSlot, pyqtSignal, QAbstractListModel, QModelIndex, Qt, QTimer
+)
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QPushButton, QTextEdit, QLabel, QDialogButtonBox, QComboBox
+    QWidget, QVBoxLayout, QPushButton, QListView, QComboBox, QMessageBox
 )
 
 from qiwis import BaseApp
@@ -17,47 +21,146 @@ class _Signaller(QObject):
     """Signal only for LoggingHandler.
 
     Signals:
-        signal(log): A formatted log message is emitted. 
+        signal: Emitted when a record is queued after the records are taken.
     """
 
-    signal = pyqtSignal(str)
+    signal = pyqtSignal()
 
 
 class LoggingHandler(logging.Handler):
     """Handler for logger.
 
-    Sends a log message to the connected function through a signal. 
+    Queues log messages and notifies the connected function through a signal.
+    The signal is emitted only for the first record queued after the records are
+      taken, so that a burst of records does not flood the GUI event queue.
+    The queue is bounded, and the oldest records are dropped when it is full.
 
     Attributes:
-        signaller: A _Signaller class contains signal for emitting log.
+        signaller: A _Signaller class contains signal for notifying queued logs.
+        records: A deque of (creation time, formatted log message) tuples
+          which are not taken yet. The time is in seconds since the epoch.
+        notified: True if the signal is emitted after the records are taken.
+        droppedCount: The number of records dropped since the records are taken.
     """
 
-    def __init__(self, slotfunc: Callable[[str], Any]):
+    def __init__(self, slotfunc: Callable[[], Any], maxCount: int = 10000):
         """Extended.
 
-        Connects the slotfunc to the signal.
+        Connects the slotfunc to the signal, which is always queued.
 
         Args:
-            slotfunc: A slot function which is called when a log record is emitted.
+            slotfunc: A slot function which is called when log records are queued.
+              It should take the records by self.takeRecords().
+            maxCount: The maximum number of records in the queue.
         """
         super().__init__()
+        self.records = deque(maxlen=maxCount)
+        self.notified = False
+        self.droppedCount = 0
         self.signaller = _Signaller()
-        self.signaller.signal.connect(slotfunc)
+        self.signaller.signal.connect(slotfunc, type=Qt.QueuedConnection)
 
     def emit(self, record: logging.LogRecord):
         """Overridden.
         
-        Emits input signal to the connected function.
+        Queues the log message, and emits the signal if it is not emitted yet.
+        It is called with the handler lock acquired.
+        The record is not even formatted if nothing is connected to the signal,
+          e.g., after the slot owner is destroyed.
         """
+        if not self.signaller.receivers(self.signaller.signal):
+            return
         logMsg = self.format(record)
-        self.signaller.signal.emit(logMsg)
+        if len(self.records) == self.records.maxlen:
+            self.droppedCount += 1
+        self.records.append((record.created, logMsg))
+        if not self.notified:
+            self.notified = True
+            self.signaller.signal.emit()
+
+    def takeRecords(self) -> Tuple[Tuple[Tuple[float, str], ...], int]:
+        """Takes all the queued records out.
+
+        Returns:
+            A tuple of (creation time, formatted log message) tuples in order,
+              and the number of records dropped before them.
+        """
+        with self.lock:
+            records = tuple(self.records)
+            droppedCount = self.droppedCount
+            self.records.clear()
+            self.notified = False
+            self.droppedCount = 0
+        return records, droppedCount
+
+
+class LogModel(QAbstractListModel):
+    """List model of log messages.
+
+    Only the latest messages are kept, and the oldest one is dropped
+      when a new message is added to the full model.
+
+    Attributes:
+        logs: A deque of (time string, log message) tuples.
+    """
+
+    def __init__(self, maxCount: int = 10000, parent: Optional[QObject] = None):
+        """Extended.
+
+        Args:
+            maxCount: The maximum number of log messages to keep.
+        """
+        super().__init__(parent=parent)
+        self.logs = deque(maxlen=maxCount)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Overridden."""
+        return 0 if parent.isValid() else len(self.logs)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Optional[str]:
+        """Overridden.
+
+        The log message is formatted only when it is shown.
+        """
+        if role != Qt.DisplayRole:
+            return None
+        timeString, content = self.logs[index.row()]
+        return f"{timeString}: {content}"
+
+    def addLogs(self, logs: Sequence[Tuple[str, str]]):
+        """Adds log messages at the end at once.
+
+        The oldest messages are dropped in a single removal if the model overflows.
+
+        Args:
+            logs: A sequence of (time string, log message) tuples.
+        """
+        logs = logs[-self.logs.maxlen:]
+        if not logs:
+            return
+        overflow = len(self.logs) + len(logs) - self.logs.maxlen
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            for _ in range(overflow):
+                self.logs.popleft()
+            self.endRemoveRows()
+        row = len(self.logs)
+        self.beginInsertRows(QModelIndex(), row, row + len(logs) - 1)
+        self.logs.extend(logs)
+        self.endInsertRows()
+
+    def clear(self):
+        """Removes all the log messages."""
+        self.beginResetModel()
+        self.logs.clear()
+        self.endResetModel()
 
 
 class LoggerFrame(QWidget):
     """Frame for logging.
 
     Attributes:
-        logEdit: A textEdit which shows all logs.
+        logView: A list view which shows all logs.
         clearButton: A button for clearing all logs.
         levelBox: A comboBox for setting the logger's level.
     """
@@ -66,85 +169,79 @@ class LoggerFrame(QWidget):
         """Extended."""
         super().__init__(parent=parent)
         # widgets
-        self.logEdit = QTextEdit(self)
-        self.logEdit.setReadOnly(True)
+        self.logView = QListView(self)
+        self.logView.setUniformItemSizes(True)
         self.clearButton = QPushButton("Clear", self)
         self.levelBox = QComboBox(self)
         # layout
         layout = QVBoxLayout(self)
-        layout.addWidget(self.logEdit)
+        layout.addWidget(self.logView)
         layout.addWidget(self.clearButton)
         layout.addWidget(self.levelBox)
 
 
-class ConfirmClearingFrame(QWidget):
-    """A confirmation frame for log clearing in the LoggerFrame.
-    
-    Attributes:
-        label: The label for displaying a confirmation message to clear logs in the LoggerFrame.
-        buttonBox: The buttonBox with OK and Cancel button to check whether to clear logs.
-
-    Signals:
-        confirmed: A pyqtSignal that emits signal when Ok button is clicked. 
-    """
-
-    confirmed = pyqtSignal()
-
-    def __init__(self, parent: Optional[QObject] = None):
-        """Extended."""
-        super().__init__(parent=parent)
-        # widgets
-        self.label = QLabel("Are you sure to clear?", self)
-        self.buttonBox = QDialogButtonBox(self)
-        self.buttonBox.addButton("OK", QDialogButtonBox.AcceptRole)
-        self.buttonBox.addButton("Cancel", QDialogButtonBox.RejectRole)
-        # connect signals
-        self.buttonBox.accepted.connect(self.buttonOKClicked)
-        self.buttonBox.rejected.connect(self.buttonCancelClicked)
-        # layouts
-        layout = QVBoxLayout(self)
-        layout.addWidget(self.label)
-        layout.addWidget(self.buttonBox)
-
-    def buttonOKClicked(self):
-        """Called when the OK button is clicked."""
-        self.confirmed.emit()
-        self.close()
-
-    def buttonCancelClicked(self):
-        """Called when the Cancel button is clicked."""
-        self.close()
-
-
 class LoggerApp(BaseApp):
     """App for logging.
 
-    Sets a handler of the root logger and manages the loggerFrame to show log messages.
+    Sets a handler of the target logger and manages the loggerFrame to show log messages.
     Gives options to clear logs and select log level in the loggerFrame.
 
     Attributes:
+        targetLogger: The logger whose records, including those propagated from its
+          descendants, are shown. Its level is set by the levelBox.
+        logModel: A model of the logs, which is shown in loggerFrame.
         loggerFrame: A frame that shows the logs.
-        confirmFrame: A frame that asks whether to clear logs.
-        handler: A handler for adding logs to the loggerFrame. 
+        handler: A handler which queues logs for the loggerFrame.
+        flushTimer: A single-shot timer for adding the queued logs to logModel at once.
+        lastTime: A (epoch second, formatted time string) tuple of the latest
+          log message, for reusing the time string within the same second.
     """
 
-    def __init__(self, name: str, parent: Optional[QObject] = None):
-        """Extended."""
+    # level name -> logging level, in the order shown in the levelBox.
+    LEVELS = {
+        "DEBUG": logging.DEBUG,
+        "INFO": logging.INFO,
+        "WARNING": logging.WARNING,
+        "ERROR": logging.ERROR,
+        "CRITICAL": logging.CRITICAL
+    }
+
+    def __init__(
+        self,
+        name: str,
+        maxLogCount: int = 5000,
+        loggerName: str = "",
+        parent: Optional[QObject] = None):
+        """Extended.
+
+        Args:
+            maxLogCount: The maximum number of log messages shown in loggerFrame.
+              The oldest messages are dropped beyond this count.
+            loggerName: A name of the target logger, e.g., "examples".
+              The root logger is used by default, hence all the records are shown.
+              A named logger confines the handler and the level to its subtree,
+              so that the other records do not reach the handler at all.
+        """
         super().__init__(name, parent=parent)
+        self.targetLogger = logging.getLogger(loggerName or None)
+        self.logModel = LogModel(maxLogCount, parent=self)
         self.loggerFrame = LoggerFrame()
-        self.confirmFrame = ConfirmClearingFrame()
+        self.loggerFrame.logView.setModel(self.logModel)
+        self.flushTimer = QTimer(self)
+        self.flushTimer.setSingleShot(True)
+        self.flushTimer.setInterval(16)
+        self.flushTimer.timeout.connect(self.flushLogs)
+        self.lastTime = (-1, "")
         # connect signals to slots
         self.loggerFrame.clearButton.clicked.connect(self.checkToClear)
-        self.confirmFrame.confirmed.connect(self.clearLog)
-        self.handler = LoggingHandler(self.addLog)
+        self.handler = LoggingHandler(self.flushTimer.start, maxLogCount)
         # TODO(aijuh): Change the log format when it is determined.
         fs = "%(levelname)s [%(name)s] [%(filename)s:%(lineno)d] %(message)s"
         formatter = logging.Formatter(fs)
         self.handler.setFormatter(formatter)
-        rootLogger = logging.getLogger()
-        rootLogger.addHandler(self.handler)
+        self.targetLogger.addHandler(self.handler)
         self.setLevel("WARNING")
-        self.loggerFrame.levelBox.addItems(["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"])
+        self.loggerFrame.levelBox.addItems(self.LEVELS)
         self.loggerFrame.levelBox.textActivated.connect(self.setLevel)
         self.loggerFrame.levelBox.setCurrentText("WARNING")
 
@@ -157,38 +254,56 @@ class LoggerApp(BaseApp):
               It should be one of "DEBUG", "INFO", "WARNING", "ERROR" and "CRITICAL".
               It should be case-sensitive and any other input is ignored.
         """
-        levels = {
-            "DEBUG": logging.DEBUG,
-            "INFO": logging.INFO,
-            "WARNING": logging.WARNING,
-            "ERROR": logging.ERROR,
-            "CRITICAL": logging.CRITICAL
-        }
-        if levelText in levels:
-            self.handler.setLevel(levels[levelText])
-            logging.getLogger().setLevel(levels[levelText])
+        level = self.LEVELS.get(levelText)
+        if level is not None:
+            self.handler.setLevel(level)
+            self.targetLogger.setLevel(level)
 
     def frames(self) -> Tuple[Tuple[str, LoggerFrame]]:
         """Overridden."""
         return (("", self.loggerFrame),)
 
-    @pyqtSlot(str)
-    def addLog(self, content: str):
-        """Adds a received log message to the LoggerFrame.
-
-        Args:
-            content: Received log message.
+    @pyqtSlot()
+    def flushLogs(self):
+        """Adds the queued log messages to the LoggerFrame at once.
+
+        The time string is formatted only once per second.
+        If some messages were dropped from the queue, it is noted after the others,
+          so that the note is not pushed out of the full model by them.
+        The messages which the note would push out of the full model are also
+          dropped in advance, and counted in the note.
         """
-        timeString = QDateTime.currentDateTime().toString("yyyy-MM-dd HH:mm:ss")
-        self.loggerFrame.logEdit.insertPlainText(f"{timeString}: {content}\n")
+        records, droppedCount = self.handler.takeRecords()
+        if droppedCount:
+            lastCreated = records[-1][0]
+            overflow = max(0, len(records) + 1 - self.logModel.logs.maxlen)
+            records = records[overflow:]
+            droppedCount += overflow
+            note = f"{droppedCount} earlier log messages were dropped since they came too fast."
+            records += ((lastCreated, note),)
+        logs = []
+        for created, content in records:
+            second = int(created)
+            if second != self.lastTime[0]:
+                timeString = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+                self.lastTime = (second, timeString)
+            logs.append((self.lastTime[1], content))
+        self.logModel.addLogs(logs)
 
     @pyqtSlot()
     def checkToClear(self):
-        """Shows a confirmation frame for clearing logs."""
+        """Asks whether to clear logs, and clears them if it is confirmed."""
         logger.info("Tried to clear logs by clicking clear button")
-        self.confirmFrame.show()
+        answer = QMessageBox.question(
+            self.loggerFrame, "Clear logs", "Are you sure to clear?",
+            QMessageBox.Ok | QMessageBox.Cancel
+        )
+        if answer == QMessageBox.Ok:
+            self.clearLog()
 
     @pyqtSlot()
     def clearLog(self):
-        """Clears the log texts in loggerFrame."""
-        self.loggerFrame.logEdit.clear()
+        """Clears the logs in loggerFrame."""
+        self.flushTimer.stop()
+        self.handler.takeRecords()
+        self.logModel.clear()
@@ -7,14 +7,17 @@ import json
 import logging
 from typing import Any, Optional, Tuple, Union
 
-from PyQt5.QtCore import QObject, pyqtSlot
+from PyQt5.QtCore import QObject, QSignalBlocker, pyqtSignal, pyqtSlot
 from PyQt5.QtWidgets import QWidget, QComboBox, QPushButton, QLabel, QVBoxLayout
 
 from qiwis import BaseApp
-from examples.backend import generate, write
+from examples.backend import generate, write_async
 
 logger = logging.getLogger(__name__)
 
+# The keys which every database in the db channel message should have.
+_DB_KEYS = frozenset(("name", "path"))
+
 
 class GeneratorFrame(QWidget):
     """Frame for requesting generating a random number.
@@ -66,11 +69,22 @@ class NumGenApp(BaseApp):
         table: A name of table to store the generated number.
         dbs: A dictionary for storing available databases.
           Each element represents a database.
-          A key is a file name and its value is an absolute path.
+          A key is a file name and its value is the path of the database file,
+          which is joined once when the database is added.
         dbName: A name of the selected database.
         generatorFrame: A frame that requests generating a random number.
         viewerFrame: A frame that shows the generated number.
+
+    Signals:
+        saved(success): True if the generated number is saved successfully, otherwise False.
+          It is emitted in the writer thread of the backend.
     """
+
+    # channel name -> name of the handler method which takes the received dictionary.
+    CHANNEL_HANDLERS = {"db": "updateDB"}
+
+    saved = pyqtSignal(bool)
+
     def __init__(self, name: str, table: str = "number", parent: Optional[QObject] = None):
         """Extended.
 
@@ -88,6 +102,7 @@ class NumGenApp(BaseApp):
         # connect signals to slots
         self.generatorFrame.dbBox.currentIndexChanged.connect(self.setDB)
         self.generatorFrame.generateButton.clicked.connect(self.generateNumber)
+        self.saved.connect(self.showSaveResult)
 
     def frames(self) -> Tuple[Tuple[str, Union[GeneratorFrame, ViewerFrame]], ...]:
         """Overridden.
@@ -106,28 +121,43 @@ class NumGenApp(BaseApp):
             The new database is always added at the end.
             Changing the order of the databases is not allowed.
 
+        Only the added and removed databases are applied to the combobox,
+          with its signals blocked. Then, self.setDB() is called only when
+          the selected database is removed.
+
         Args:
             content: Received content.
               The structure follows the message protocol of DBMgrApp.
         """
-        originalDBs = set(self.dbs)
-        newDBs = set([""])
+        newDBs = {""}
+        addingDBs = []
         for db in content.get("db", ()):
-            if any(key not in db for key in ("name", "path")):
+            if not _DB_KEYS <= db.keys():
                 logger.error("The message was ignored because "
                              "the database %s has no such key; name or path.", json.dumps(db))
                 continue
             name, path = db["name"], db["path"]
             newDBs.add(name)
             if name not in self.dbs:
-                self.dbs[name] = path
-                self.generatorFrame.dbBox.addItem(name)
-        removingDBs = originalDBs - newDBs
-        if self.generatorFrame.dbBox.currentText() in removingDBs:
-            self.generatorFrame.dbBox.setCurrentText("")
+                self.dbs[name] = os.path.join(path, name)
+                addingDBs.append(name)
+        # the added databases are in newDBs, hence only the missing ones remain
+        removingDBs = self.dbs.keys() - newDBs
+        if not addingDBs and not removingDBs:
+            return
+        # the combobox has the databases in the same order as self.dbs
+        removingRows = [row for row, name in enumerate(self.dbs) if name in removingDBs]
         for name in removingDBs:
             self.dbs.pop(name)
-            self.generatorFrame.dbBox.removeItem(self.generatorFrame.dbBox.findText(name))
+        dbBox = self.generatorFrame.dbBox
+        with QSignalBlocker(dbBox):
+            if dbBox.currentText() in removingDBs:
+                dbBox.setCurrentText("")
+            dbBox.addItems(addingDBs)
+            for row in reversed(removingRows):
+                dbBox.removeItem(row)
+        if dbBox.currentText() != self.dbName:
+            self.setDB()
 
     def receivedSlot(self, channelName: str, content: Any):
         """Overridden.
@@ -136,15 +166,17 @@ class NumGenApp(BaseApp):
 
         "db": Database channel.
             See self.updateDB().
+
+        The content is passed to the handler method of the channel in CHANNEL_HANDLERS.
         """
-        if channelName == "db":
-            if isinstance(content, dict):
-                self.updateDB(content)
-            else:
-                logger.error("The message for the channel db should be a dictionary.")
-        else:
+        handlerName = self.CHANNEL_HANDLERS.get(channelName)
+        if handlerName is None:
             logger.error("The message was ignored because "
                          "the treatment for the channel %s is not implemented.", channelName)
+        elif isinstance(content, dict):
+            getattr(self, handlerName)(content)
+        else:
+            logger.error("The message for the channel %s should be a dictionary.", channelName)
 
     @pyqtSlot()
     def setDB(self):
@@ -158,7 +190,11 @@ class NumGenApp(BaseApp):
 
     @pyqtSlot()
     def generateNumber(self):
-        """Generates and shows a random number when the button is clicked."""
+        """Generates and shows a random number when the button is clicked.
+
+        The number is saved in the writer thread of the backend, and the result is
+          shown by self.showSaveResult().
+        """
         # generate a random number
         num = generate()
         if not self.isGenerated:
@@ -167,9 +203,21 @@ class NumGenApp(BaseApp):
         self.viewerFrame.numberLabel.setText(f"generated number: {num}")
         logger.info("Generated number: %d.", num)
         # save the generated number
-        dbPath = self.dbs[self.dbName]
-        is_save_success = write(os.path.join(dbPath, self.dbName), self.table, num)
-        if is_save_success:
+        path = self.dbs[self.dbName]
+        if not path:
+            # no database is selected, hence it fails without going through the writer
+            self.showSaveResult(False)
+            return
+        write_async(path, self.table, num, self.saved.emit)
+
+    @pyqtSlot(bool)
+    def showSaveResult(self, success: bool):
+        """Shows whether the generated number is saved.
+
+        Args:
+            success: True if the number is saved successfully, otherwise False.
+        """
+        if success:
             self.viewerFrame.statusLabel.setText("number saved successfully")
             logger.info("Generated number saved.")
         else:
@@ -7,14 +7,17 @@ import json
 import logging
 from typing import Any, Optional, Tuple
 
-from PyQt5.QtCore import QObject, pyqtSlot, QTimer
+from PyQt5.QtCore import QObject, QSignalBlocker, Qt, pyqtSignal, pyqtSlot, QTimer
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QComboBox, QSpinBox, QLabel
 
 from qiwis import BaseApp
-from examples.backend import poll, write
+from examples.backend import poll, write_async
 
 logger = logging.getLogger(__name__)
 
+# The keys which every database in the db channel message should have.
+_DB_KEYS = frozenset(("name", "path"))
+
 
 class ViewerFrame(QWidget):
     """Frame for selecting a database and period, and showing the polled number.
@@ -54,12 +57,25 @@ class PollerApp(BaseApp):
         table: A name of table to store the polled number.
         dbs: A dictionary for storing available databases.
           Each element represents a database.
-          A key is a file name and its value is an absolute path.
+          A key is a file name and its value is the path of the database file,
+          which is joined once when the database is added.
         dbName: A name of the selected database.
         viewerFrame: A frame that selects a database and period, and shows the polled number.
         count: The polled count. It starts from 0.
         timer: A QTimer object for polling. The initial interval is a second.
+          Since the period is a whole number of seconds, it only keeps full second
+          accuracy so that the system can coalesce its wakeups with others.
+
+    Signals:
+        saved(success): True if the polled number is saved successfully, otherwise False.
+          It is emitted in the writer thread of the backend.
     """
+
+    # channel name -> name of the handler method which takes the received dictionary.
+    CHANNEL_HANDLERS = {"db": "updateDB"}
+
+    saved = pyqtSignal(bool)
+
     def __init__(self, name: str, table: str = "B", parent: Optional[QObject] = None):
         """Extended.
 
@@ -75,9 +91,11 @@ class PollerApp(BaseApp):
         # connect signals to slots
         self.viewerFrame.dbBox.currentIndexChanged.connect(self.setDB)
         self.viewerFrame.periodBox.valueChanged.connect(self.setPeriod)
+        self.saved.connect(self.showSaveResult)
         # start timer
         self.count = 0
         self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.VeryCoarseTimer)
         self.timer.start(1000 * self.viewerFrame.periodBox.value())
         self.timer.timeout.connect(self.poll)
 
@@ -92,28 +110,43 @@ class PollerApp(BaseApp):
             The new database is always added at the end.
             Changing the order of the databases is not allowed.
 
+        Only the added and removed databases are applied to the combobox,
+          with its signals blocked. Then, self.setDB() is called only when
+          the selected database is removed.
+
         Args:
             content: Received content.
               The structure follows the message protocol of DBMgrApp.
         """
-        originalDBs = set(self.dbs)
-        newDBs = set([""])
+        newDBs = {""}
+        addingDBs = []
         for db in content.get("db", ()):
-            if any(key not in db for key in ("name", "path")):
+            if not _DB_KEYS <= db.keys():
                 logger.error("The message was ignored because "
                              "the database %s has no such key; name or path.", json.dumps(db))
                 continue
             name, path = db["name"], db["path"]
             newDBs.add(name)
             if name not in self.dbs:
-                self.dbs[name] = path
-                self.viewerFrame.dbBox.addItem(name)
-        removingDBs = originalDBs - newDBs
-        if self.viewerFrame.dbBox.currentText() in removingDBs:
-            self.viewerFrame.dbBox.setCurrentText("")
+                self.dbs[name] = os.path.join(path, name)
+                addingDBs.append(name)
+        # the added databases are in newDBs, hence only the missing ones remain
+        removingDBs = self.dbs.keys() - newDBs
+        if not addingDBs and not removingDBs:
+            return
+        # the combobox has the databases in the same order as self.dbs
+        removingRows = [row for row, name in enumerate(self.dbs) if name in removingDBs]
         for name in removingDBs:
             self.dbs.pop(name)
-            self.viewerFrame.dbBox.removeItem(self.viewerFrame.dbBox.findText(name))
+        dbBox = self.viewerFrame.dbBox
+        with QSignalBlocker(dbBox):
+            if dbBox.currentText() in removingDBs:
+                dbBox.setCurrentText("")
+            dbBox.addItems(addingDBs)
+            for row in reversed(removingRows):
+                dbBox.removeItem(row)
+        if dbBox.currentText() != self.dbName:
+            self.setDB()
 
     def receivedSlot(self, channelName: str, content: Any):
         """Overridden.
@@ -122,15 +155,17 @@ class PollerApp(BaseApp):
 
         "db": Database channel.
             See self.updateDB().
+
+        The content is passed to the handler method of the channel in CHANNEL_HANDLERS.
         """
-        if channelName == "db":
-            if isinstance(content, dict):
-                self.updateDB(content)
-            else:
-                logger.error("The message for the channel db should be a dictionary.")
-        else:
+        handlerName = self.CHANNEL_HANDLERS.get(channelName)
+        if handlerName is None:
             logger.error("The message was ignored because "
                          "the treatment for the channel %s is not implemented.", channelName)
+        elif isinstance(content, dict):
+            getattr(self, handlerName)(content)
+        else:
+            logger.error("The message for the channel %s should be a dictionary.", channelName)
 
     @pyqtSlot()
     def setPeriod(self):
@@ -150,15 +185,32 @@ class PollerApp(BaseApp):
 
     @pyqtSlot()
     def poll(self):
-        """Polls and store a number with the selected period."""
+        """Polls and store a number with the selected period.
+
+        The number is saved in the writer thread of the backend, and the result is
+          logged by self.showSaveResult().
+        """
         num = poll()
         self.count += 1
         self.viewerFrame.countLabel.setText(f"polled count: {self.count}")
         self.viewerFrame.numberLabel.setText(f"polled number: {num}")
         logger.info("Polled number: %d.", num)
         # save the polled number
-        dbPath = self.dbs[self.dbName]
-        if write(os.path.join(dbPath, self.dbName), self.table, num):
+        path = self.dbs[self.dbName]
+        if not path:
+            # no database is selected, hence it fails without going through the writer
+            self.showSaveResult(False)
+            return
+        write_async(path, self.table, num, self.saved.emit)
+
+    @pyqtSlot(bool)
+    def showSaveResult(self, success: bool):
+        """Logs whether the polled number is saved.
+
+        Args:
+            success: True if the number is saved successfully, otherwise False.
+        """
+        if success:
             logger.info("Polled number saved.")
         else:
             logger.error("Failed to save polled number.")
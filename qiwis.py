@@ -14,6 +14,7 @@ Logging:
 
 import argparse
 import dataclasses
+import enum
 import functools
 import importlib
 import importlib.util
@@ -22,6 +23,7 @@ import json
 import logging
 import os
 import sys
+import uuid
 from collections import defaultdict, namedtuple
 from contextlib import contextmanager
 from types import MappingProxyType
@@ -30,6 +32,10 @@ from typing import (
     List, Union, TypeVar, Type
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot, Qt
 from PyQt5.QtGui import QIcon, QPainter, QPaintEvent, QPixmap, QCloseEvent
 from PyQt5.QtWidgets import (
@@ -102,10 +108,49 @@ def loads(cls: Type[T], kwargs: str) -> T:
 def dumps(obj: Serializable) -> str:
     """Returns a JSON string converted from the given Serializable object.
     
+    The result is the same as converting the dictionary yielded by asdict(),
+      but the fields are not deep-copied in advance.
+
     Args:
         obj: Dataclass object to convert to a JSON string.
     """
-    return json.dumps(dataclasses.asdict(obj))
+    return json.dumps(_fields_dict(obj), default=_encode_dataclass)
+
+
+@functools.lru_cache(maxsize=None)
+def _field_names(cls: type) -> Tuple[str, ...]:
+    """Returns the field names of the given dataclass, which are cached per class.
+
+    Args:
+        cls: Dataclass to get its field names.
+    """
+    return tuple(field.name for field in dataclasses.fields(cls))
+
+
+def _fields_dict(obj: Any) -> Dict[str, Any]:
+    """Returns a shallow dictionary of the fields of the given dataclass object.
+
+    Args:
+        obj: Dataclass object.
+    """
+    return {name: getattr(obj, name) for name in _field_names(type(obj))}
+
+
+def _encode_dataclass(obj: Any) -> Dict[str, Any]:
+    """Returns a dictionary of the fields of a nested dataclass object for json.dumps().
+
+    It is given as the default argument of json.dumps(), which calls it only for
+      the objects that are not JSONifiable by themselves.
+
+    Args:
+        obj: An object found while encoding.
+
+    Raises:
+        TypeError: When obj is not a dataclass object.
+    """
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return _fields_dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 @dataclasses.dataclass
@@ -455,6 +500,10 @@ class Qiwis(QObject):
 
         It checks the function signature of the call and converts the JSON string
         arguments to concrete dataclass instances if the parameter type is Serializable.
+        The signature is inspected only once per function, and a bound method shares
+        it with the other bound methods of the same function.
+        A parameter whose annotation is not a class, e.g., Optional[str], is regarded
+        as a non-Serializable type.
 
         The limitation of this implementation is that it can only support a single
         concrete type for each method parameter, i.e., it does not support union types,
@@ -468,11 +517,11 @@ class Qiwis(QObject):
             A dictionary of the same arguments as args, but with concrete Serializable
             dataclass instances instead of JSON strings.
         """
-        signature = inspect.signature(call)
+        serializableTypes = _serializable_types(getattr(call, "__func__", call))
         parsedArgs = {}
         for name, arg in args.items():
-            cls = signature.parameters[name].annotation
-            parsedArgs[name] = loads(cls, arg) if issubclass(cls, Serializable) else arg
+            cls = serializableTypes[name]
+            parsedArgs[name] = arg if cls is None else loads(cls, arg)
         logger.debug("Parsed arguments %s to %s", args, parsedArgs)
         return parsedArgs
 
@@ -593,12 +642,15 @@ class BaseApp(QObject):
     def broadcast(self, channelName: str, content: Any):
         """Broadcasts the content to the target channel.
 
+        The content is converted by orjson if it is installed, otherwise by json.
+        Either way, the message is decoded to the same object. See _json_dumps().
+
         Args:
             channelName: Target channel name.
             content: Content to be broadcast. It should be able to be converted to JSON object.
         """
         try:
-            msg = json.dumps(content)
+            msg = _json_dumps(content)
         except TypeError:
             logger.exception("Failed to broadcast the content: %s", content)
         else:
@@ -826,6 +878,81 @@ def _read_config_file(config_path: str) -> Tuple[Dict[str, AppInfo], Dict[str, J
     return app_infos, constants
 
 
+@functools.lru_cache(maxsize=None)
+def _serializable_types(func: Callable) -> Mapping[str, Optional[Type[Serializable]]]:
+    """Returns the Serializable types of the parameters of the given function.
+
+    The result is cached per function since its signature does not change.
+
+    Args:
+        func: Function object to inspect its signature.
+
+    Returns:
+        A read-only dictionary whose keys are the parameter names and values are
+        their annotations if they are Serializable subclasses, otherwise None.
+    """
+    types = {}
+    for name, param in inspect.signature(func).parameters.items():
+        cls = param.annotation
+        is_serializable = isinstance(cls, type) and issubclass(cls, Serializable)
+        types[name] = cls if is_serializable else None
+    return MappingProxyType(types)
+
+
+def _json_dumps(obj: Any) -> str:
+    """Returns a JSON string converted from the given object.
+
+    It uses orjson if it is installed, which is much faster than json.
+    Since the result must be decoded to the same object as the result of json,
+      it falls back to json in the following cases:
+        orjson fails to convert obj, e.g., an integer larger than 64 bits,
+          a non-string dictionary key, or a dataclass, datetime or subclass object,
+          which orjson converts but json does not.
+        The result contains null, which may be converted from NaN or infinity
+          by orjson, while json converts them to NaN and Infinity.
+    UUID and Enum objects, which orjson always converts, are converted by json
+      in the same way, i.e., to the string and the value, respectively.
+
+    Args:
+        obj: A JSONifiable object.
+
+    Raises:
+        TypeError: When obj is not JSONifiable.
+    """
+    if orjson is not None:
+        option = (
+            orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_SUBCLASS
+        )
+        try:
+            msg = orjson.dumps(obj, option=option)
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            if b"null" not in msg:
+                return msg.decode()
+    return json.dumps(obj, default=_encode_orjson_native)
+
+
+def _encode_orjson_native(obj: Any) -> Any:
+    """Returns a JSONifiable object for a UUID or Enum object, as orjson does.
+
+    It is given as the default argument of json.dumps().
+
+    Args:
+        obj: An object which is not JSONifiable by json itself.
+
+    Raises:
+        TypeError: When obj is neither a UUID nor an Enum object.
+    """
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 def _immutable(source: JsonType) -> ImmutableJsonType:
     """Returns the immutable version of the given JSON object.
 
@@ -22,6 +22,7 @@ setup(
     download_url="https://github.com/snu-quiqcl/qiwis/releases/tag/v3.0.1",
     license="MIT license",
     install_requires=["pyqt5"],
+    extras_require={"orjson": ["orjson"]},
     py_modules=["qiwis"],
     entry_points={
         "console_scripts": ["qiwis = qiwis:main"]
@@ -4,9 +4,13 @@ Module for testing qiwis module.
 
 import collections.abc
 import dataclasses
+import datetime
+import enum
+import inspect
 import sys
 import json
 import unittest
+import uuid
 from unittest import mock
 from types import MappingProxyType
 from typing import Any, Optional, Mapping, Iterable
@@ -295,6 +299,18 @@ class QiwisTestWithoutApps(unittest.TestCase):
         parsed_args = self.qiwis._parseArgs(call_for_test, json_args)
         self.assertEqual(args, parsed_args)
 
+    @mock.patch("qiwis.inspect.signature", wraps=inspect.signature)
+    def test_parse_args_cached(self, mocked_signature):
+        qiwis._serializable_types.cache_clear()
+        args = {"name": "app"}
+        for _ in range(2):
+            self.assertEqual(self.qiwis._parseArgs(self.qiwis.destroyApp, args), args)
+        mocked_signature.assert_called_once_with(qiwis.Qiwis.destroyApp)
+
+    def test_parse_args_generic(self):
+        args = {"icon_path": None}
+        self.assertEqual(self.qiwis._parseArgs(self.qiwis.setIcon, args), args)
+
 @mock.patch("qiwis.loads")
 @mock.patch("qiwis.QMessageBox.warning")
 class HandleQiwiscallTest(unittest.TestCase):
@@ -395,6 +411,52 @@ class BaseAppTest(unittest.TestCase):
         self.app.broadcast("ch1", lambda: None)
         self.app.broadcastRequested.emit.assert_not_called()
 
+    @mock.patch("qiwis.orjson", None)
+    def test_broadcast_without_orjson(self):
+        self.app.broadcastRequested = mock.MagicMock()
+        self.app.broadcast("ch1", {"key": ["value"]})
+        self.app.broadcastRequested.emit.assert_called_once_with("ch1", '{"key": ["value"]}')
+
+    def help_round_trip(self, content: Any):
+        """Broadcasts the content and receives the emitted message.
+
+        Args:
+            content: Content to be broadcast, which should be received as it is.
+        """
+        self.app.broadcastRequested = mock.MagicMock()
+        self.app.receivedSlot = mock.MagicMock()
+        self.app.broadcast("ch1", content)
+        self.app._receivedMessage(*self.app.broadcastRequested.emit.call_args.args)
+        self.app.receivedSlot.assert_called_once_with("ch1", content)
+
+    def help_round_trips(self):
+        for content in ({"n": 2 ** 70}, [2 ** 64], [float("inf")], [1.5, None], {"key": "é"}):
+            with self.subTest(content=content):
+                self.help_round_trip(content)
+
+    @unittest.skipUnless(qiwis.orjson, "orjson is not installed")
+    def test_round_trip_with_orjson(self):
+        self.help_round_trips()
+
+    @mock.patch("qiwis.orjson", None)
+    def test_round_trip_without_orjson(self):
+        self.help_round_trips()
+
+    def test_broadcast_orjson_native(self):
+        class EnumForTest(enum.Enum):
+            A = 1
+        uuid_value = uuid.uuid4()
+        self.app.broadcastRequested = mock.MagicMock()
+        self.app.broadcast("ch1", [uuid_value, EnumForTest.A])
+        _, msg = self.app.broadcastRequested.emit.call_args.args
+        self.assertEqual(json.loads(msg), [str(uuid_value), 1])
+
+    @unittest.skipUnless(qiwis.orjson, "orjson is not installed")
+    def test_broadcast_orjson_passthrough(self):
+        self.app.broadcastRequested = mock.MagicMock()
+        self.app.broadcast("ch1", [datetime.date.today()])
+        self.app.broadcastRequested.emit.assert_not_called()
+
     def test_received_message(self):
         self.app.receivedSlot = mock.MagicMock()
         self.app._receivedMessage("ch1", '"msg"')
@@ -405,6 +467,12 @@ class BaseAppTest(unittest.TestCase):
         self.app._receivedMessage("ch1", '"msg1" "msg2"')
         self.app.receivedSlot.assert_not_called()
 
+    @mock.patch("qiwis.orjson", None)
+    def test_received_message_without_orjson(self):
+        self.app.receivedSlot = mock.MagicMock()
+        self.app._receivedMessage("ch1", '{"key": ["value"]}')
+        self.app.receivedSlot.assert_called_once_with("ch1", {"key": ["value"]})
+
     def test_received_qiwiscall_result(self):
         self.app.qiwiscall.update_result = mock.MagicMock()
         self.app._receivedQiwiscallResult(
@@ -538,6 +606,30 @@ class QiwisFunctionTest(unittest.TestCase):
         self.assertEqual(qiwis.dumps(APP_INFOS["app1"]), APP_JSONS["app1"])
         self.assertEqual(qiwis.dumps(APP_INFOS["app2"]), APP_JSONS["app2"])
 
+    def test_dumps_nested(self):
+        @dataclasses.dataclass
+        class InnerForTest:
+            number: float
+        @dataclasses.dataclass
+        class ClassForTest(qiwis.Serializable):
+            inner: InnerForTest
+            inners: list
+        obj = ClassForTest(InnerForTest(1.5), [InnerForTest(0), {"key": InnerForTest(-1)}])
+        self.assertEqual(qiwis.dumps(obj), json.dumps(dataclasses.asdict(obj)))
+
+    def test_dumps_not_jsonifiable(self):
+        @dataclasses.dataclass
+        class ClassForTest(qiwis.Serializable):
+            value: Any
+        with self.assertRaises(TypeError):
+            qiwis.dumps(ClassForTest(object()))
+
+    def test_field_names(self):
+        self.assertEqual(
+            qiwis._field_names(qiwis.AppInfo),
+            ("module", "cls", "path", "pos", "channel", "trust", "args")
+        )
+
     @mock.patch("qiwis.namedtuple")
     @mock.patch("qiwis._immutable")
     @mock.patch("qiwis.BaseApp")